@@ -2,13 +2,190 @@
 
 import os
 import enum
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from json import loads
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterator, Tuple
+
+try:
+    # much faster, only used when asked for since it parses some numbers differently
+    import orjson
+except ImportError:
+    orjson = None
+
+# Read buffer size, large enough that most files need only a few read() calls.
+_BUFFER_SIZE = 65536
+
+# Contents of recently read files, shared by all FileManipulators. Keyed on
+# (device, inode), holding (mtime, size, contents) so changed files don't match.
+# Off unless enabled with set_shared_cache_limit.
+_contents_cache: "OrderedDict[Tuple[int, int], Tuple[int, int, bytes]]" = OrderedDict()
+_contents_cache_lock = threading.Lock()
+# Most bytes kept at once, 0 when the cache is disabled.
+_contents_cache_limit = 0
+# Bytes currently kept.
+_contents_cache_bytes = 0
+
+
+def set_shared_cache_limit(max_bytes: int) -> None:
+    """
+    Enable (or disable) sharing file contents between FileManipulators.
+
+    When enabled, [FileManipulator.refresh] reuses the contents of a recently read
+    file instead of reading it again, as long as its modification time and size
+    are unchanged.
+
+    !!! danger "Trusting modification times"
+        A file rewritten with the same size within one timestamp tick (up to 2
+        seconds on some filesystems), or whose modification time was restored
+        (like with `cp -p`), will be served from the cache with its old contents.
+        Only enable this for files that aren't changed that way.
+
+    Arguments:
+        max_bytes: The most bytes of file contents to keep, or 0 to disable the
+            cache and empty it. Files bigger than this are never kept.
+
+    Returns:
+        Nothing.
+    """
+    global _contents_cache_limit
+    with _contents_cache_lock:
+        _contents_cache_limit = max(0, max_bytes)
+        _trim_contents()
+
+
+def clear_shared_cache() -> None:
+    """
+    Empty the cache enabled with [set_shared_cache_limit], keeping it enabled.
+
+    Returns:
+        Nothing.
+    """
+    global _contents_cache_bytes
+    with _contents_cache_lock:
+        _contents_cache.clear()
+        _contents_cache_bytes = 0
+
+
+def _trim_contents() -> None:
+    """
+    Evict the least recently used files until the cache fits its limit.
+
+    The caller must hold `_contents_cache_lock`.
+
+    Returns:
+        Nothing.
+    """
+    global _contents_cache_bytes
+    while _contents_cache_bytes > _contents_cache_limit:
+        _contents_cache_bytes -= len(_contents_cache.popitem(last=False)[1][2])
+
+
+def _lookup_contents(st: os.stat_result) -> Optional[bytes]:
+    """
+    Find a file's contents in the shared cache.
+
+    Arguments:
+        st: The file's status.
+
+    Returns:
+        The contents, or None if the file isn't cached or has changed since.
+    """
+    global _contents_cache_bytes
+    key = (st.st_dev, st.st_ino)
+    with _contents_cache_lock:
+        entry = _contents_cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] != st.st_mtime_ns or entry[1] != st.st_size:
+            # outdated, don't hold on to it
+            del _contents_cache[key]
+            _contents_cache_bytes -= len(entry[2])
+            return None
+        _contents_cache.move_to_end(key)
+        return entry[2]
+
+
+def _store_contents(st: os.stat_result, raw: bytes) -> None:
+    """
+    Add a file's contents to the shared cache, evicting old entries if full.
+
+    Arguments:
+        st: The file's status when it was read.
+        raw: The file's contents.
+
+    Returns:
+        Nothing.
+    """
+    global _contents_cache_bytes
+    key = (st.st_dev, st.st_ino)
+    with _contents_cache_lock:
+        if len(raw) > _contents_cache_limit:
+            return
+        old = _contents_cache.pop(key, None)
+        if old is not None:
+            _contents_cache_bytes -= len(old[2])
+        _contents_cache[key] = (st.st_mtime_ns, st.st_size, raw)
+        _contents_cache_bytes += len(raw)
+        _trim_contents()
+
+
+def _forget_contents(st: os.stat_result) -> None:
+    """
+    Remove a file from the shared cache.
+
+    Arguments:
+        st: The file's status.
+
+    Returns:
+        Nothing.
+    """
+    global _contents_cache_bytes
+    with _contents_cache_lock:
+        entry = _contents_cache.pop((st.st_dev, st.st_ino), None)
+        if entry is not None:
+            _contents_cache_bytes -= len(entry[2])
+
+
+def _forget_written_contents(fd: int) -> None:
+    """
+    Remove a file that was just written to from the shared cache, if enabled.
+
+    Arguments:
+        fd: A file descriptor open on the file.
+
+    Returns:
+        Nothing.
+    """
+    if _contents_cache_limit:
+        _forget_contents(os.fstat(fd))
+
+
+def _decode(data: bytes) -> str:
+    """
+    Decode raw file contents the same way text mode would.
+
+    Arguments:
+        data: The raw file contents.
+
+    Returns:
+        The decoded text, with newlines translated to `\\n`.
+    """
+    text = data.decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
 
 
 class AbstractFile:
     """A file in instance form."""
 
+    __slots__ = ("_name", "_abs")
+
+    _name: str
+    _abs: Optional[str]
+
     def __init__(self, name: str) -> None:
         """
         Creates the class.
@@ -19,7 +196,32 @@ class AbstractFile:
         Returns:
             Nothing.
         """
-        self.name = name
+        self._name = name
+        self._abs = None
+
+    @property
+    def name(self) -> str:
+        """
+        The file name.
+
+        Returns:
+            The file name.
+        """
+        return self._name
+
+    @name.setter
+    def name(self, name: str) -> None:
+        """
+        Change the file name, dropping the cached absolute path.
+
+        Arguments:
+            name: The new file name.
+
+        Returns:
+            Nothing.
+        """
+        self._name = name
+        self._abs = None
 
     def __str__(self) -> str:
         """
@@ -28,7 +230,7 @@ class AbstractFile:
         Returns:
             The name of the file.
         """
-        return self.name
+        return self._name
 
     def __abs__(self) -> str:
         """
@@ -36,10 +238,19 @@ class AbstractFile:
 
         Provides the absolute path to the file.
 
+        Relative names are resolved against the current working directory on every
+        call, while the result for absolute names is cached.
+
         Returns:
             The absolute path to the file.
         """
-        return os.path.abspath(self.name)
+        if self._abs is not None:
+            return self._abs
+        path = os.path.abspath(self._name)
+        if os.path.isabs(self._name):
+            # doesn't depend on the working directory, so it can't go stale
+            self._abs = path
+        return path
 
     def touch(self) -> None:
         """
@@ -54,7 +265,8 @@ class AbstractFile:
         Raises:
             PermissionError: If you don't have needed permission to access the file.
         """
-        open(str(self), mode="a").close()
+        # a bare file descriptor is all that's needed, skip building a file object
+        os.close(os.open(str(self), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o666))
 
     def exists(self, touch_if_false: Optional[bool] = False) -> bool:
         """
@@ -89,8 +301,12 @@ class AbstractFile:
 class FileManipulator:
     """Class used for managing an assigned file."""
 
-    cache: List[str]
+    __slots__ = ("_linked_abstractfile", "_raw", "_lines", "_slim")
+
     _linked_abstractfile: AbstractFile
+    _raw: Optional[bytes]
+    _lines: Optional[List[str]]
+    _slim: bool
 
     def __init__(self, abstract_file: AbstractFile) -> None:
         """
@@ -105,13 +321,37 @@ class FileManipulator:
         Raises:
             TypeError: If the argument isn't an AbstractFile.
         """
-        self.cache = []
+        self._raw = None
+        self._lines = []
+        self._slim = False
         if type(abstract_file) == AbstractFile:
             self._linked_abstractfile = abstract_file
         else:
             raise TypeError("Wrong type! Please pass AbstractFile or string")
         self.refresh()
 
+    @classmethod
+    def bulk_load(cls, names: List[str]) -> List["FileManipulator"]:
+        """
+        Create manipulators for many files at once.
+
+        The files are read from a thread pool, so time spent waiting on the
+        filesystem overlaps instead of adding up one file after another.
+
+        Arguments:
+            names: The file names.
+
+        Returns:
+            The manipulators, in the same order as `names`.
+
+        Raises:
+            PermissionError: If you don't have needed permission to access one of the files.
+        """
+        if len(names) < 2:
+            return [cls(AbstractFile(name)) for name in names]
+        with ThreadPoolExecutor(max_workers=min(32, len(names))) as pool:
+            return list(pool.map(lambda name: cls(AbstractFile(name)), names))
+
     def get_file(self) -> AbstractFile:
         """
         Get the AbstractFile instance.
@@ -134,6 +374,10 @@ class FileManipulator:
         """
         Update the cache.
 
+        The file is read once, and only split into lines when the cache is
+        first accessed. If enabled with [set_shared_cache_limit], the contents
+        of recently read files are reused instead of being read again.
+
         Arguments:
             slim: If empty lines should be removed.
 
@@ -143,19 +387,80 @@ class FileManipulator:
         Raises:
             PermissionError: If you don't have needed permission to access the file.
         """
-        if not self.get_file().exists():
+        self._slim = slim
+        try:
+            fh = open(self.get_file_name(), mode="rb", buffering=0)
+        except FileNotFoundError:
             # file doesn't exist, exit early
+            self._raw = None
+            self._lines = []
             return
 
-        with open(self.get_file_name(), mode="r") as fh:
-            self.cache = fh.readlines()
-            # strip newlines
-            for h, g in enumerate(self.cache):
-                if slim and self.cache[h] == "":
-                    self.cache.pop(h)
+        with fh:
+            self._raw = None
+            st = None
+            if _contents_cache_limit:
+                st = os.fstat(fh.fileno())
+                # files like those in /proc report a size of 0, never share those
+                if 0 < st.st_size <= _contents_cache_limit:
+                    self._raw = _lookup_contents(st)
                 else:
-                    self.cache[h] = self.cache[h].replace("\n", "")
-            fh.close()
+                    st = None
+            if self._raw is None:
+                # readall() sizes its buffer from fstat, and keeps reading to EOF
+                self._raw = fh.read()
+                # only share what matches the size the status was taken with
+                if st is not None and len(self._raw) == st.st_size:
+                    _store_contents(st, self._raw)
+        self._lines = None
+
+    def _invalidate(self) -> None:
+        """
+        Forget the file's contents, so they are read again when next needed.
+
+        Returns:
+            Nothing.
+        """
+        self._raw = None
+        self._lines = None
+
+    @property
+    def cache(self) -> List[str]:
+        """
+        The file's lines at the time of the last refresh.
+
+        Returns:
+            The cache.
+        """
+        if self._lines is None:
+            if self._raw is None:
+                # the file was changed through this class since the last refresh
+                self.refresh(self._slim)
+            if self._lines is None:
+                # newlines are already translated, so a memchr-driven split on "\n"
+                # is enough, and splits exactly where text mode reading would
+                lines = _decode(self._raw).split("\n")
+                # the lines are all that's needed from now on
+                self._raw = None
+                if not lines[-1]:
+                    # trailing newline (or empty file)
+                    lines.pop()
+                # filter(None, ...) drops empty lines without running bytecode per line
+                self._lines = list(filter(None, lines)) if self._slim else lines
+        return self._lines
+
+    @cache.setter
+    def cache(self, value: List[str]) -> None:
+        """
+        Replace the cache, until the next refresh.
+
+        Arguments:
+            value: The new list of lines.
+
+        Returns:
+            Nothing.
+        """
+        self._lines = value
 
     def get_cache(self) -> List[str]:
         """
@@ -165,13 +470,39 @@ class FileManipulator:
         last refresh.
 
         Refreshes are called when this class is created,
-        or when manually triggered by [refresh].
+        when manually triggered by [refresh], or after the file is changed
+        through this class.
 
         Returns:
             The cache.
         """
         return self.cache
 
+    def iter_lines(self) -> Iterator[str]:
+        """
+        Lazily iterate over the file's lines, without newlines.
+
+        Unlike [get_cache], which is the eager alternative, only one line is held
+        in memory at a time, so this is better suited to large files that only
+        need to be read through once.
+
+        !!! warning
+            This function does not use the cache.
+
+        Returns:
+            An iterator over the file's lines.
+
+        Raises:
+            PermissionError: If you don't have needed permission to access the file.
+            FileNotFoundError: If the file doesn't exist.
+        """
+        with open(
+            self.get_file_name(), mode="r", encoding="utf-8", buffering=_BUFFER_SIZE
+        ) as fh:
+            fh._CHUNK_SIZE = _BUFFER_SIZE
+            for line in fh:
+                yield line[:-1] if line.endswith("\n") else line
+
     def write_to_file(self, string: str) -> None:
         """
         Write to the file.
@@ -180,6 +511,9 @@ class FileManipulator:
             Please ensure that what you are writing to the file
             is a string.
 
+        The string is written as UTF-8, and newlines are written as they are
+        (`\n` is never translated to `\r\n`, even on Windows).
+
         Arguments:
             string: What to write to the file.
 
@@ -191,9 +525,41 @@ class FileManipulator:
         Returns:
             Nothing.
         """
-        e = open(str(self.get_file()), mode="w")
-        e.write(string)
-        e.close()
+        if not isinstance(string, str):
+            raise TypeError("expected str, got " + type(string).__name__)
+
+        # invalidate first, so the cache is never trusted after a failed write
+        self._invalidate()
+
+        if len(string) > _BUFFER_SIZE:
+            # newline="" writes "\n" as is, like the small write path below
+            with open(
+                str(self.get_file()),
+                mode="w",
+                encoding="utf-8",
+                newline="",
+                buffering=_BUFFER_SIZE,
+            ) as e:
+                try:
+                    e.write(string)
+                    e.flush()
+                finally:
+                    _forget_written_contents(e.fileno())
+            return
+
+        # small writes go straight to the file descriptor, skipping the text layer
+        data = memoryview(string.encode("utf-8"))
+        # O_BINARY stops Windows from translating newlines, it doesn't exist elsewhere
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        fd = os.open(str(self.get_file()), flags, 0o666)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            try:
+                _forget_written_contents(fd)
+            finally:
+                os.close(fd)
 
     def clear_file(self) -> None:
         """
@@ -208,7 +574,12 @@ class FileManipulator:
             PermissionError: If you don't have needed permission to access the file.
             FileNotFoundError: If the file doesn't exist.
         """
-        open(str(self.get_file()), mode="w").close()
+        self._invalidate()
+        fd = os.open(str(self.get_file()), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            _forget_written_contents(fd)
+        finally:
+            os.close(fd)
 
     def get_file_contents_singlestring(self) -> str:
         """
@@ -224,10 +595,28 @@ class FileManipulator:
             PermissionError: If you don't have needed permission to access the file.
             FileNotFoundError: If the file doesn't exist.
         """
-        o = open(str(self.get_file()), mode="r")
-        string = o.read()
-        o.close()
-        return string
+        return _decode(self.get_file_contents_bytes())
+
+    def get_file_contents_bytes(self) -> bytes:
+        """
+        Get the file's contents as raw bytes, without decoding them.
+
+        This skips decoding entirely, so prefer it for anything that doesn't
+        need text, like hashing or parsing JSON.
+
+        !!! warning
+            This function does not use the cache.
+
+        Returns:
+            The file's contents.
+
+        Raises:
+            PermissionError: If you don't have needed permission to access the file.
+            FileNotFoundError: If the file doesn't exist.
+        """
+        with open(str(self.get_file()), mode="rb", buffering=0) as fh:
+            # readall() sizes its buffer from fstat, and keeps reading to EOF
+            return fh.read()
 
     def delete(self) -> bool:
         """
@@ -239,15 +628,33 @@ class FileManipulator:
         Raises:
             PermissionError: If you don't have needed permission to access the file.
         """
-        if self.get_file().exists():
+        self._invalidate()
+        try:
+            if _contents_cache_limit:
+                # the inode could be reused by a new file, so drop it from the cache
+                _forget_contents(os.stat(str(self.get_file())))
             os.remove(str(self.get_file()))
-            return True
-        return False
+        except FileNotFoundError:
+            return False
+        return True
 
-    def load_from_json(self) -> Dict[str, Any]:
+    def load_from_json(self, fast: bool = False) -> Dict[str, Any]:
         """
         Loads the file, and returns the dictionary containing the data.
 
+        !!! warning
+            This function does not use the cache.
+
+        !!! tip "Faster parsing"
+            Passing `fast=True` uses [orjson](https://pypi.org/project/orjson/)
+            instead of the built-in `json` module, if it is installed
+            (`pip install filehandlers[speedups]`). Note that orjson turns integers
+            that don't fit in 64 bits into (imprecise) floats. `NaN` and `Infinity`
+            are still accepted, by falling back to the `json` module.
+
+        Arguments:
+            fast: If orjson should be used when it is installed.
+
         Returns:
             The dictionary with the data.
 
@@ -256,10 +663,45 @@ class FileManipulator:
             PermissionError: If you don't have needed permission to access the file.
             FileNotFoundError: If the file doesn't exist.
         """
-        return loads(self.get_file_contents_singlestring())
+        data = self.get_file_contents_bytes()
+        if fast and orjson is not None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # orjson rejects NaN and Infinity, which json accepts
+                pass
+        return loads(data)
 
+    def iter_json_items(self, prefix: str = "item") -> Iterator[Any]:
+        """
+        Lazily parse the file as JSON, yielding the objects found under `prefix`.
+
+        Only one object is held in memory at a time, so this works for files that
+        are too large for [load_from_json], which stays the eager variant.
+
+        !!! note
+            This requires [ijson](https://pypi.org/project/ijson/) to be installed
+            (`pip install filehandlers[stream]`).
+
+        Arguments:
+            prefix: The ijson prefix of the objects to yield. The default,
+                `item`, yields each element of a top-level array.
 
-class OpenModes(enum.Enum):
+        Returns:
+            An iterator over the matching objects.
+
+        Raises:
+            ImportError: If ijson isn't installed.
+            PermissionError: If you don't have needed permission to access the file.
+            FileNotFoundError: If the file doesn't exist.
+        """
+        import ijson
+
+        with open(self.get_file_name(), mode="rb") as fh:
+            yield from ijson.items(fh, prefix)
+
+
+class OpenModes(str, enum.Enum):
     """
     Enum for the different options you can pass to the
     keyword argument `mode` in Python's `open` function.
@@ -268,7 +710,7 @@ class OpenModes(enum.Enum):
 
     ```python
     from filehandlers import OpenModes
-    open("myfile.txt", mode=OpenModes.READ.value)
+    open("myfile.txt", mode=OpenModes.READ)
     ```
 
     This can help so you don't need to remember all the different
@@ -284,25 +726,25 @@ class OpenModes(enum.Enum):
         while binary mode must be used when writing non-text files like images.
     """
 
-    """Read only access to the file."""
     READ = "r"
-    """Read only access to the file (binary enabled)."""
+    """Read only access to the file."""
     READ_BINARY = "rb"
-    """Write only access to the file - ***see warning above***."""
+    """Read only access to the file (binary enabled)."""
     WRITE = "w"
-    """Write only access to the file - ***see warning above*** (binary enabled)."""
+    """Write only access to the file - ***see warning above***."""
     WRITE_BINARY = "wb"
-    """Clear the file."""
+    """Write only access to the file - ***see warning above*** (binary enabled)."""
     CLEAR = WRITE
-    """Append to the end of the file (also gives read!)."""
+    """Clear the file."""
     APPEND = "a"
-    """Create the file - ***raises error if file exists***."""
+    """Append to the end of the file (also gives read!)."""
     CREATE = "x"
-    """Create the file and ready it to be written to."""
+    """Create the file - ***raises error if file exists***."""
     CREATE_AND_WRITE = "w+"
-    """The default option for the built-in `open` function."""
+    """Create the file and ready it to be written to."""
     TEXT = "t"
-    """Open in binary mode."""
+    """The default option for the built-in `open` function."""
     BINARY = "b"
-    """This will open a file for reading and writing (updating)."""
+    """Open in binary mode."""
     UPDATING = "+"
+    """This will open a file for reading and writing (updating)."""
@@ -2,7 +2,7 @@ import setuptools
 
 setuptools.setup(
     name="filehandlers",
-    version="3.1.0",
+    version="4.0.0",
     license="MIT",
     description="Package containing code to help in working with files.",
     packages=setuptools.find_packages(),
@@ -19,7 +19,8 @@ setuptools.setup(
     include_package_data=True,
     zip_safe=False,
     keywords=["file", "files", "handler", "handlers", "io"],
-    python_requires=">=3.3",
+    python_requires=">=3.6",
+    extras_require={"speedups": ["orjson"], "stream": ["ijson"]},
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Developers",
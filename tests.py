@@ -1,6 +1,8 @@
 import unittest
+import importlib.util
 import filehandlers
 import textwrap
+import math
 import os
 
 
@@ -44,11 +46,176 @@ class Tests(unittest.TestCase):
             ),  # noqa
         )
 
+    def test_open_modes_are_strings(self):
+        """Test that OpenModes members can be passed to open() as they are."""
+        self.assertEqual(filehandlers.OpenModes.READ, "r")
+        self.assertIs(filehandlers.OpenModes.CLEAR, filehandlers.OpenModes.WRITE)
+        with open(str(self.af), mode=filehandlers.OpenModes.READ) as b:
+            self.assertEqual(b.read(), "")
+
+    def test_write_and_clear(self):
+        """Test writing small and large strings, and clearing the file."""
+        big = "line\n" * 20000
+        self.m.write_to_file(big)
+        self.assertEqual(self.m.get_file_contents_singlestring(), big)
+        self.assertEqual(self.m.get_file_contents_bytes(), big.encode())
+        self.m.write_to_file("small")
+        self.assertEqual(self.m.get_file_contents_singlestring(), "small")
+        with self.assertRaises(TypeError):
+            self.m.write_to_file(b"bytes")
+        self.m.clear_file()
+        self.assertEqual(self.m.get_file_contents_singlestring(), "")
+
+    def test_cache_follows_writes(self):
+        """Test that writing through the manipulator updates the cache."""
+        self.m.write_to_file('{"a": 1}')
+        self.assertEqual(self.m.get_cache(), ['{"a": 1}'])
+        self.assertEqual(self.m.load_from_json(), {"a": 1})
+        self.m.clear_file()
+        self.assertEqual(self.m.get_cache(), [])
+
+    def test_load_from_json_rereads(self):
+        """Test that loading JSON sees changes made outside the manipulator."""
+        self.m.write_to_file('{"a": 1}')
+        m = filehandlers.FileManipulator(self.af)
+        with open(str(self.af), mode="w") as b:
+            b.write('{"a": 2}')
+        self.assertEqual(m.load_from_json(), {"a": 2})
+        self.assertEqual(m.get_cache(), ['{"a": 1}'])
+
+    def test_bulk_load(self):
+        """Test creating many manipulators at once."""
+        self.m.write_to_file("first\nsecond")
+        names = ["test.txt", "missing.txt", "test.txt"]
+        loaded = filehandlers.FileManipulator.bulk_load(names)
+        self.assertEqual([m.get_file_name() for m in loaded], names)
+        self.assertEqual(loaded[0].get_cache(), ["first", "second"])
+        self.assertEqual(loaded[1].get_cache(), [])
+
+    def test_refresh_rereads_by_default(self):
+        """Test that refreshing rereads the file even if its mtime and size match."""
+        self.m.write_to_file("aaa")
+        st = os.stat(str(self.af))
+        with open(str(self.af), mode="w") as b:
+            b.write("bbb")
+        os.utime(str(self.af), ns=(st.st_atime_ns, st.st_mtime_ns))
+        self.m.refresh()
+        self.assertEqual(self.m.get_cache(), ["bbb"])
+
+    def test_shared_contents(self):
+        """Test sharing file contents between manipulators when enabled."""
+        filehandlers.set_shared_cache_limit(1 << 20)
+        self.addCleanup(filehandlers.set_shared_cache_limit, 0)
+        self.m.write_to_file("abc")
+        self.assertEqual(filehandlers.FileManipulator(self.af).get_cache(), ["abc"])
+        # writes through any manipulator evict the file, even keeping mtime and size
+        st = os.stat(str(self.af))
+        self.m.write_to_file("xyz")
+        os.utime(str(self.af), ns=(st.st_atime_ns, st.st_mtime_ns))
+        other = filehandlers.FileManipulator(self.af)
+        self.assertEqual(other.get_cache(), ["xyz"])
+        other.get_cache().append("changed")
+        self.assertEqual(filehandlers.FileManipulator(self.af).get_cache(), ["xyz"])
+        # an external rewrite keeping mtime and size is only seen after clearing
+        st = os.stat(str(self.af))
+        with open(str(self.af), mode="w") as b:
+            b.write("123")
+        os.utime(str(self.af), ns=(st.st_atime_ns, st.st_mtime_ns))
+        self.assertEqual(filehandlers.FileManipulator(self.af).get_cache(), ["xyz"])
+        filehandlers.clear_shared_cache()
+        self.assertEqual(filehandlers.FileManipulator(self.af).get_cache(), ["123"])
+        self.m.write_to_file("456")
+        os.utime(str(self.af), ns=(st.st_atime_ns, st.st_mtime_ns))
+        self.assertEqual(filehandlers.FileManipulator(self.af).get_cache(), ["456"])
+        self.m.clear_file()
+        self.assertEqual(filehandlers.FileManipulator(self.af).get_cache(), [])
+        # files bigger than the limit are never kept
+        filehandlers.set_shared_cache_limit(2)
+        self.assertEqual(filehandlers._contents_cache_bytes, 0)
+        self.m.refresh()
+        self.assertEqual(len(filehandlers._contents_cache), 0)
+
+    def test_line_endings(self):
+        """Test that every newline style is stripped from cached lines."""
+        self.m.write_to_file("unix\nwindows\r\nmac\rlast")
+        self.assertEqual(self.m.get_cache(), ["unix", "windows", "mac", "last"])
+
+    def test_iter_lines(self):
+        """Test lazily iterating over the file's lines."""
+        self.m.write_to_file("a\r\n\nb")
+        self.assertEqual(list(self.m.iter_lines()), ["a", "", "b"])
+
+    def test_slim_refresh(self):
+        """Test that slim refreshes drop empty lines."""
+        self.m.write_to_file("a\n\nb\r\n\r\nc\n")
+        self.m.refresh()
+        self.assertEqual(self.m.get_cache(), ["a", "", "b", "", "c"])
+        self.m.refresh(slim=True)
+        self.assertEqual(self.m.get_cache(), ["a", "b", "c"])
+        other = filehandlers.FileManipulator(self.af)
+        other.refresh(slim=True)
+        self.assertEqual(other.get_cache(), ["a", "b", "c"])
+        other.refresh()
+        self.assertEqual(other.get_cache(), ["a", "", "b", "", "c"])
+        self.m.write_to_file("form\x0cfeed\n")
+        self.assertEqual(self.m.get_cache(), ["form\x0cfeed"])
+
+    def test_file_contents(self):
+        """Test reading the whole file as bytes and as a string."""
+        self.assertEqual(self.m.get_file_contents_bytes(), b"")
+        self.assertEqual(self.m.get_file_contents_singlestring(), "")
+        self.m.write_to_file("one\r\ntwo\n")
+        self.assertEqual(self.m.get_file_contents_bytes(), b"one\r\ntwo\n")
+        self.assertEqual(self.m.get_file_contents_singlestring(), "one\ntwo\n")
+        big = b"x" * (4 << 20)
+        self.m.write_to_file(big.decode())
+        self.assertEqual(self.m.get_file_contents_bytes(), big)
+
+    def test_load_from_json(self):
+        """Test that JSON files can be loaded."""
+        self.m.write_to_file('{"a": [1, 2], "b": "é"}')
+        self.assertEqual(self.m.load_from_json(), {"a": [1, 2], "b": "é"})
+        self.assertEqual(self.m.load_from_json(fast=True), {"a": [1, 2], "b": "é"})
+        self.m.write_to_file('{"n": 123456789012345678901234567890, "f": NaN}')
+        data = self.m.load_from_json()
+        self.assertEqual(data["n"], 123456789012345678901234567890)
+        self.assertTrue(math.isnan(data["f"]))
+        self.assertTrue(math.isnan(self.m.load_from_json(fast=True)["f"]))
+        self.m.write_to_file("{")
+        with self.assertRaises(ValueError):
+            self.m.load_from_json()
+        with self.assertRaises(ValueError):
+            self.m.load_from_json(fast=True)
+
+    @unittest.skipUnless(importlib.util.find_spec("ijson"), reason="ijson not installed")
+    def test_iter_json_items(self):
+        """Test that JSON arrays can be streamed item by item."""
+        self.m.write_to_file('[{"a": 1}, {"b": 2}]')
+        self.assertEqual(list(self.m.iter_json_items()), [{"a": 1}, {"b": 2}])
+
+    def test_abspath_follows_renames(self):
+        """Test that the cached absolute path is updated when the name changes."""
+        af = filehandlers.AbstractFile("one.txt")
+        self.assertEqual(abs(af), os.path.abspath("one.txt"))
+        af.name = "two.txt"
+        self.assertEqual(abs(af), os.path.abspath("two.txt"))
+        cwd = os.getcwd()
+        self.addCleanup(os.chdir, cwd)
+        os.chdir(os.path.dirname(cwd))
+        self.assertEqual(abs(af), os.path.abspath("two.txt"))
+        af.name = os.path.join(cwd, "three", "..", "three.txt")
+        self.assertEqual(abs(af), os.path.join(cwd, "three.txt"))
+
     @unittest.skipUnless(os.getenv("CIRRUS_CI") is not None, reason="not CI")
     def test_abspath(self):
         """Test that the absolute path of the file is correct if in CI."""
         self.assertEqual(abs(self.af), "/tmp/cirrus-ci-build/test.txt")
 
+    def test_no_instance_dict(self):
+        """Test that instances use slots instead of a __dict__."""
+        self.assertFalse(hasattr(self.af, "__dict__"))
+        self.assertFalse(hasattr(self.m, "__dict__"))
+
     def test_semistrict_types(self):
         """Test that FileManipulators can only be created with AbstractFiles."""
         with self.assertRaises(TypeError):